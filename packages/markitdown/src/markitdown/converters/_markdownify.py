@@ -1,9 +1,157 @@
 import re
+import string
+import functools
 import markdownify
 
 from typing import Any, Optional
 from urllib.parse import quote, unquote, urlparse, urlunparse
 
+# Optionally use google-re2 (a DFA-based engine) for the sup/sub pattern below, which
+# is run over the entire converted document. Falls back to the standard library.
+try:
+    import re2 as _sup_sub_re
+except ImportError:
+    _sup_sub_re = re  # type: ignore
+
+# Sentinels emitted around <sup>/<sub> text when latex_sup_sub is enabled,
+# and rewritten into LaTeX once the whole document has been converted
+_SUP_START = "__MARKITDOWN_SUP_START__"
+_SUP_END = "__MARKITDOWN_SUP_END__"
+_SUB_START = "__MARKITDOWN_SUB_START__"
+_SUB_END = "__MARKITDOWN_SUB_END__"
+
+# A base followed by either a superscript or a subscript, handled in a single pass
+_SUP_SUB_RE = _sup_sub_re.compile(
+    rf"(?P<base>[A-Za-z0-9]+)"
+    rf"(?:{_SUP_START}(?P<sup>.*?){_SUP_END}|{_SUB_START}(?P<sub>.*?){_SUB_END})"
+)
+
+# Sentinels left over once the sup/sub pass is done (e.g., scripts with no base)
+_SENTINEL_RE = re.compile(f"{_SUP_START}|{_SUP_END}|{_SUB_START}|{_SUB_END}")
+_SENTINEL_REPLACEMENTS = {_SUP_START: "^", _SUP_END: "", _SUB_START: "_", _SUB_END: ""}
+
+# Inside another script, leftover scripts are braced so they stay grouped
+_NESTED_SENTINEL_REPLACEMENTS = {
+    _SUP_START: "^{",
+    _SUP_END: "}",
+    _SUB_START: "_{",
+    _SUB_END: "}",
+}
+
+# Translation tables for escaping link/image titles, and flattening image alt text
+_TITLE_TABLE = str.maketrans({'"': r"\""})
+_ALT_TABLE = str.maketrans({"\n": " "})
+
+# Characters that survive the escaping in _normalize_href unchanged. http(s) URLs made
+# up solely of these (no port, query, or fragment) are returned as-is.
+_PLAIN_URL_CHARS = frozenset(string.ascii_letters + string.digits + "-._~/")
+
+# Inline ($...$) or display ($$...$$) math, ignoring escaped dollar signs
+_MATH_RE = re.compile(
+    r"(?<!\\)(?:\$\$.*?(?<!\\)\$\$|\$(?!\$).*?(?<!\\)\$)",
+    re.DOTALL,
+)
+
+
+# Longer link targets (e.g., inline data: URIs) are escaped without being cached,
+# so the cache never keeps large strings alive
+_MAX_CACHED_HREF_LENGTH = 2048
+
+
+def _normalize_href(href: str) -> Optional[str]:
+    """
+    Escape the path of a link target. Returns None if the link should be dropped
+    (non-http or file schemes, or URIs that cannot be parsed), in which case only
+    the link text is kept.
+
+    Short targets are cached, since they tend to repeat across a page (nav bars,
+    footers, etc.)
+    """
+    if len(href) <= _MAX_CACHED_HREF_LENGTH:
+        return _cached_escape_href(href)
+    return _escape_href(href)
+
+
+def _escape_href(href: str) -> Optional[str]:
+    scheme, _, rest = href.partition("://")
+    if (
+        scheme in ("http", "https")
+        and not rest.startswith("/")
+        and _PLAIN_URL_CHARS.issuperset(rest)
+    ):
+        return href
+
+    try:
+        parsed_url = urlparse(href)  # type: ignore
+        if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
+            return None
+        return urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
+    except ValueError:  # It's not clear if this ever gets thrown
+        return None
+
+
+_cached_escape_href = functools.lru_cache(maxsize=4096)(_escape_href)
+
+
+def _format_latex_script(script_text: str, script_char: str) -> str:
+    cleaned = script_text.strip()
+    if cleaned.isascii() and cleaned.isalnum():
+        return f"{script_char}{cleaned}"
+    return f"{script_char}{{{cleaned}}}"
+
+
+def _rewrite_nested_scripts(script_text: str) -> str:
+    """
+    Rewrite the sup/sub sentinels inside a script's text (e.g., a <sub> within
+    a <sup>) into LaTeX, without the enclosing '$'s of a top-level script.
+    """
+    if _SUP_START not in script_text and _SUB_START not in script_text:
+        return script_text
+    updated = _SUP_SUB_RE.sub(_nested_script_repl, script_text)
+    return _SENTINEL_RE.sub(_nested_sentinel_repl, updated)
+
+
+def _format_nested_latex_script(script_text: str, script_char: str) -> str:
+    # Within a script, 'b_cd' would read as b_c followed by d, so only a single
+    # character can go without braces
+    cleaned = script_text.strip()
+    if len(cleaned) == 1 and cleaned.isascii() and cleaned.isalnum():
+        return f"{script_char}{cleaned}"
+    return f"{script_char}{{{cleaned}}}"
+
+
+def _nested_script_repl(match: re.Match[str]) -> str:
+    """Replacement for _SUP_SUB_RE matches within a script, e.g., 'b', 'cd' -> 'b_{cd}'"""
+    base = match.group("base")
+    if match.group("sup") is not None:
+        return base + _format_nested_latex_script(match.group("sup"), "^")
+    return base + _format_nested_latex_script(match.group("sub"), "_")
+
+
+def _nested_sentinel_repl(match: re.Match[str]) -> str:
+    """Replacement for _SENTINEL_RE matches within a script, e.g., a sub start -> '_{'"""
+    return _NESTED_SENTINEL_REPLACEMENTS[match.group(0)]
+
+
+def _latex_script_repl(match: re.Match[str]) -> str:
+    """Replacement for _SUP_SUB_RE matches, e.g., 'x', '2' -> '$x^2$'"""
+    base = match.group("base")
+    if match.group("sup") is not None:
+        script = _format_latex_script(match.group("sup"), "^")
+    else:
+        script = _format_latex_script(match.group("sub"), "_")
+    return f"${base}{script}$"
+
+
+def _sentinel_repl(match: re.Match[str]) -> str:
+    """Replacement for _SENTINEL_RE matches, e.g., a base-less sup start -> '^'"""
+    return _SENTINEL_REPLACEMENTS[match.group(0)]
+
+
+def _unescape_math_repl(match: re.Match[str]) -> str:
+    """Replacement for _MATH_RE matches, undoing markdownify's underscore escaping"""
+    return match.group(0).replace(r"\_", "_")
+
 
 class _CustomMarkdownify(markdownify.MarkdownConverter):
     """
@@ -23,6 +171,15 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         # Explicitly cast options to the expected type if necessary
         super().__init__(**options)
 
+        # Cache the options consulted for every element, to avoid repeated dict lookups
+        self._keep_data_uris = bool(self.options["keep_data_uris"])
+        self._latex_sup_sub = bool(self.options["latex_sup_sub"])
+        self._docx_highlight = bool(self.options["docx_highlight"])
+
+        # Set whenever a sup/sub sentinel is emitted, so that convert_soup can skip
+        # the sentinel rewriting pass for documents that don't need it
+        self._emitted_script = False
+
     def convert_hn(
         self,
         n: int,
@@ -33,7 +190,7 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
     ) -> str:
         """Same as usual, but be sure to start with a new line"""
         if not convert_as_inline:
-            if not re.search(r"^\n", text):
+            if not text.startswith("\n"):
                 return "\n" + super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
 
         return super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
@@ -58,13 +215,9 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
 
         # Escape URIs and skip non-http or file schemes
         if href:
-            try:
-                parsed_url = urlparse(href)  # type: ignore
-                if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
-                    return "%s%s%s" % (prefix, text, suffix)
-                href = urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
-            except ValueError:  # It's not clear if this ever gets thrown
-                return "%s%s%s" % (prefix, text, suffix)
+            href = _normalize_href(href)
+            if href is None:
+                return f"{prefix}{text}{suffix}"
 
         # For the replacement see #29: text nodes underscores are escaped
         if (
@@ -74,15 +227,14 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
             and not self.options["default_title"]
         ):
             # Shortcut syntax
-            return "<%s>" % href
+            return f"<{href}>"
         if self.options["default_title"] and not title:
             title = href
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
-        return (
-            "%s[%s](%s%s)%s" % (prefix, text, href, title_part, suffix)
-            if href
-            else text
-        )
+        if not href:
+            return text
+        if title:
+            return f'{prefix}[{text}]({href} "{title.translate(_TITLE_TABLE)}"){suffix}'
+        return f"{prefix}[{text}]({href}){suffix}"
 
     def convert_img(
         self,
@@ -93,12 +245,11 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
     ) -> str:
         """Same as usual converter, but removes data URIs"""
 
-        alt = el.attrs.get("alt", None) or ""
-        src = el.attrs.get("src", None) or el.attrs.get("data-src", None) or ""
-        title = el.attrs.get("title", None) or ""
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        alt = el.attrs.get("alt", "")
+        src = el.attrs.get("src") or el.attrs.get("data-src") or ""
+        title = el.attrs.get("title", "")
         # Remove all line breaks from alt
-        alt = alt.replace("\n", " ")
+        alt = alt.translate(_ALT_TABLE)
         if (
             convert_as_inline
             and el.parent.name not in self.options["keep_inline_images_in"]
@@ -106,10 +257,12 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
             return alt
 
         # Remove dataURIs
-        if src.startswith("data:") and not self.options["keep_data_uris"]:
+        if src.startswith("data:") and not self._keep_data_uris:
             src = src.split(",")[0] + "..."
 
-        return "![%s](%s%s)" % (alt, src, title_part)
+        if title:
+            return f'![{alt}]({src} "{title.translate(_TITLE_TABLE)}")'
+        return f"![{alt}]({src})"
 
     def convert_input(
         self,
@@ -124,10 +277,10 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
             return "[x] " if el.has_attr("checked") else "[ ] "
         return ""
 
-    _SUP_START = "__MARKITDOWN_SUP_START__"
-    _SUP_END = "__MARKITDOWN_SUP_END__"
-    _SUB_START = "__MARKITDOWN_SUB_START__"
-    _SUB_END = "__MARKITDOWN_SUB_END__"
+    _SUP_START = _SUP_START
+    _SUP_END = _SUP_END
+    _SUB_START = _SUB_START
+    _SUB_END = _SUB_END
 
     def convert_sup(
         self,
@@ -136,8 +289,12 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         convert_as_inline: Optional[bool] = False,
         **kwargs,
     ) -> str:
-        if not self.options.get("latex_sup_sub", False):
+        if not self._latex_sup_sub:
             return super().convert_sup(el, text, convert_as_inline, **kwargs)  # type: ignore
+        self._emitted_script = True
+        # Any scripts nested within this one are rewritten now, while their
+        # sentinels are still balanced (the outer pass pairs them lazily)
+        text = _rewrite_nested_scripts(text)
         return f"{self._SUP_START}{text}{self._SUP_END}"
 
     def convert_sub(
@@ -147,25 +304,23 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         convert_as_inline: Optional[bool] = False,
         **kwargs,
     ) -> str:
-        if not self.options.get("latex_sup_sub", False):
+        if not self._latex_sup_sub:
             return super().convert_sub(el, text, convert_as_inline, **kwargs)  # type: ignore
+        self._emitted_script = True
+        text = _rewrite_nested_scripts(text)
         return f"{self._SUB_START}{text}{self._SUB_END}"
 
-    @staticmethod
-    def _format_latex_script(script_text: str, script_char: str) -> str:
-        cleaned = script_text.strip()
-        if re.fullmatch(r"[A-Za-z0-9]+", cleaned):
-            return f"{script_char}{cleaned}"
-        return f"{script_char}{{{cleaned}}}"
-
-    _HIGHLIGHT_STYLE_RE = re.compile(
-        r"(?:^|;)\s*(?:background-color|background|mso-highlight)\s*:",
-        re.IGNORECASE,
+    _HIGHLIGHT_STYLE_PROPERTIES = frozenset(
+        ["background-color", "background", "mso-highlight"]
     )
 
     @classmethod
     def _style_contains_highlight(cls, style: str) -> bool:
-        return bool(cls._HIGHLIGHT_STYLE_RE.search(style))
+        for declaration in style.split(";"):
+            name, sep, _ = declaration.partition(":")
+            if sep and name.strip().lower() in cls._HIGHLIGHT_STYLE_PROPERTIES:
+                return True
+        return False
 
     def _is_highlight_element(self, el: Any) -> bool:
         if el is None or not getattr(el, "name", None):
@@ -178,10 +333,16 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
             return False
 
         style = el.attrs.get("style", "")
-        if isinstance(style, str) and self._style_contains_highlight(style):
-            return True
+        if not style or not isinstance(style, str) or ":" not in style:
+            return False
 
-        return False
+        # Most spans carry unrelated styling; only parse the declarations if a
+        # highlight property could possibly be present
+        lowered = style.lower()
+        if "background" not in lowered and "highlight" not in lowered:
+            return False
+
+        return self._style_contains_highlight(style)
 
     @staticmethod
     def _wrap_highlight_text(text: str) -> str:
@@ -191,55 +352,35 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         return f"{prefix}=={chomped}=={suffix}"
 
     def convert_mark(self, el: Any, text: str, parent_tags: Any) -> str:
-        if self.options.get("docx_highlight", False) and self._is_highlight_element(el):
+        if self._docx_highlight and self._is_highlight_element(el):
             return self._wrap_highlight_text(text)
         return text
 
     def convert_span(self, el: Any, text: str, parent_tags: Any) -> str:
-        if self.options.get("docx_highlight", False) and self._is_highlight_element(el):
+        if self._docx_highlight and self._is_highlight_element(el):
             return self._wrap_highlight_text(text)
         return text
 
     def _convert_latex_sup_sub(self, text: str) -> str:
-        sup_pattern = re.compile(
-            rf"(?P<base>[A-Za-z0-9]+){self._SUP_START}(?P<script>.*?){self._SUP_END}"
-        )
-        sub_pattern = re.compile(
-            rf"(?P<base>[A-Za-z0-9]+){self._SUB_START}(?P<script>.*?){self._SUB_END}"
-        )
-
-        def sup_repl(match: re.Match[str]) -> str:
-            base = match.group("base")
-            script = self._format_latex_script(match.group("script"), "^")
-            return f"${base}{script}$"
-
-        def sub_repl(match: re.Match[str]) -> str:
-            base = match.group("base")
-            script = self._format_latex_script(match.group("script"), "_")
-            return f"${base}{script}$"
-
-        updated = sup_pattern.sub(sup_repl, text)
-        updated = sub_pattern.sub(sub_repl, updated)
-
-        updated = updated.replace(self._SUP_START, "^").replace(self._SUP_END, "")
-        updated = updated.replace(self._SUB_START, "_").replace(self._SUB_END, "")
-        return updated
+        # Most documents have no sup/sub at all, in which case a plain substring
+        # scan is enough to skip the regex passes entirely. The search runs directly
+        # over the str buffer, so there's no benefit to encoding to bytes first.
+        if _SUP_START not in text and _SUB_START not in text:
+            return text
+
+        updated = _SUP_SUB_RE.sub(_latex_script_repl, text)
+        return _SENTINEL_RE.sub(_sentinel_repl, updated)
 
     @staticmethod
     def _unescape_math_underscores(text: str) -> str:
-        math_pattern = re.compile(
-            r"(?<!\\)(?:\$\$.*?(?<!\\)\$\$|\$(?!\$).*?(?<!\\)\$)",
-            re.DOTALL,
-        )
-
-        def unescape(match: re.Match[str]) -> str:
-            return match.group(0).replace(r"\_", "_")
-
-        return math_pattern.sub(unescape, text)
+        return _MATH_RE.sub(_unescape_math_repl, text)
 
     def convert_soup(self, soup: Any) -> str:
+        self._emitted_script = False
         converted = super().convert_soup(soup)  # type: ignore
-        if self.options.get("latex_sup_sub", False):
-            converted = self._convert_latex_sup_sub(converted)
+        if self._latex_sup_sub:
+            if self._emitted_script:
+                converted = self._convert_latex_sup_sub(converted)
+            # Math may also come from elsewhere (e.g., DOCX equations), so always unescape
             return self._unescape_math_underscores(converted)
         return converted
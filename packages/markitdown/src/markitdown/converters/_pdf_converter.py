@@ -1,7 +1,10 @@
 import sys
 import io
 import re
-from typing import BinaryIO, Any
+import bisect
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Any, Iterable, cast
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
@@ -10,6 +13,19 @@ from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 # Pattern for MasterFormat-style partial numbering (e.g., ".1", ".2", ".10")
 PARTIAL_NUMBERING_PATTERN = re.compile(r"^\.\d+$")
 
+# Pages with more words than this (e.g. vector-heavy drawings or dense figure
+# labels) are not treated as forms, and skip the word-position analysis
+MAX_FORM_PAGE_WORDS = 10_000
+
+
+def _is_partial_numbering(text: str) -> bool:
+    """
+    Equivalent to PARTIAL_NUMBERING_PATTERN.match() for stripped text, without
+    going through the regex engine. str.isdecimal() accepts exactly the
+    characters matched by \\d.
+    """
+    return len(text) > 1 and text[0] == "." and text[1:].isdecimal()
+
 
 def _merge_partial_numbering_lines(text: str) -> str:
     """
@@ -27,32 +43,29 @@ def _merge_partial_numbering_lines(text: str) -> str:
     This function merges them back together.
     """
     lines = text.split("\n")
+    stripped_lines = [line.strip() for line in lines]
+
+    # next_nonblank[i] is the index of the first non-empty line at or after i (or -1)
+    next_nonblank = [-1] * (len(lines) + 1)
+    for i in range(len(lines) - 1, -1, -1):
+        next_nonblank[i] = i if stripped_lines[i] else next_nonblank[i + 1]
+
     result_lines: list[str] = []
     i = 0
-
     while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+        stripped = stripped_lines[i]
 
         # Check if this line is ONLY a partial numbering
-        if PARTIAL_NUMBERING_PATTERN.match(stripped):
-            # Look for the next non-empty line to merge with
-            j = i + 1
-            while j < len(lines) and not lines[j].strip():
-                j += 1
-
-            if j < len(lines):
-                # Merge the partial numbering with the next line
-                next_line = lines[j].strip()
-                result_lines.append(f"{stripped} {next_line}")
+        if _is_partial_numbering(stripped):
+            # Merge with the next non-empty line, if there is one
+            j = next_nonblank[i + 1]
+            if j != -1:
+                result_lines.append(f"{stripped} {stripped_lines[j]}")
                 i = j + 1  # Skip past the merged line
-            else:
-                # No next line to merge with, keep as is
-                result_lines.append(line)
-                i += 1
-        else:
-            result_lines.append(line)
-            i += 1
+                continue
+
+        result_lines.append(lines[i])
+        i += 1
 
     return "\n".join(result_lines)
 
@@ -66,6 +79,12 @@ try:
 except ImportError:
     _dependency_exc_info = sys.exc_info()
 
+# PDFium (installed with pdfplumber) is only used for the optional fast text path
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/pdf",
@@ -95,29 +114,52 @@ def _to_markdown_table(table: list[list[str]], include_separator: bool = True) -
     if not table:
         return ""
 
+    # Stringify each cell once
+    table = [[str(cell) for cell in row] for row in table]
+
     # Column widths
-    col_widths = [max(len(str(cell)) for cell in col) for col in zip(*table)]
+    col_widths = [max(map(len, col)) for col in zip(*table)]
 
-    def fmt_row(row: list[str]) -> str:
-        return (
-            "|"
-            + "|".join(str(cell).ljust(width) for cell, width in zip(row, col_widths))
-            + "|"
-        )
+    # Row template with each cell left-aligned to its column width
+    row_template = "|" + "|".join(f"{{:<{w}}}" for w in col_widths) + "|"
 
+    md = [row_template.format(*row) for row in table]
     if include_separator:
-        header, *rows = table
-        md = [fmt_row(header)]
-        md.append("|" + "|".join("-" * w for w in col_widths) + "|")
-        for row in rows:
-            md.append(fmt_row(row))
-    else:
-        md = [fmt_row(row) for row in table]
+        # Separator row goes right after the header
+        md.insert(1, f"|{'|'.join('-' * w for w in col_widths)}|")
 
     return "\n".join(md)
 
 
-def _extract_form_content_from_words(page: Any) -> str | None:
+def _extract_page_words(page: Any) -> list[dict]:
+    """
+    Extract the words of a PDF page with the settings used by the word-position
+    based extractors below. Done once per page, and shared between them.
+    """
+    return page.extract_words(keep_blank_chars=True, x_tolerance=3, y_tolerance=3)
+
+
+def _cluster_positions(sorted_positions: list[float], tolerance: float) -> list[float]:
+    """
+    Cluster sorted x-positions: a position starts a new cluster when it is more
+    than `tolerance` past the start of the previous cluster.
+
+    Rather than testing every position, binary search jumps straight to the
+    next cluster start, so the cost scales with the number of clusters.
+    """
+    starts: list[float] = []
+    i = 0
+    n = len(sorted_positions)
+    while i < n:
+        start = sorted_positions[i]
+        starts.append(start)
+        i = bisect.bisect_right(
+            sorted_positions, False, i, n, key=lambda x: x - start > tolerance
+        )
+    return starts
+
+
+def _extract_form_content_from_words(page: Any, words: list[dict]) -> str | None:
     """
     Extract form-style content from a PDF page by analyzing word positions.
     This handles borderless forms/tables where words are aligned in columns.
@@ -128,26 +170,28 @@ def _extract_form_content_from_words(page: Any) -> str | None:
 
     Returns None if the page doesn't appear to be a form-style document,
     indicating that pdfminer should be used instead for better text spacing.
+
+    Args:
+        page: The pdfplumber page
+        words: The page's words, as returned by _extract_page_words
     """
-    words = page.extract_words(keep_blank_chars=True, x_tolerance=3, y_tolerance=3)
-    if not words:
+    if not words or len(words) > MAX_FORM_PAGE_WORDS:
         return None
 
-    # Group words by their Y position (rows)
+    # Group words by their Y position (rows), keyed by integer bucket index
     y_tolerance = 5
-    rows_by_y: dict[float, list[dict]] = {}
+    rows_by_y: defaultdict[int, list[dict]] = defaultdict(list)
     for word in words:
-        y_key = round(word["top"] / y_tolerance) * y_tolerance
-        if y_key not in rows_by_y:
-            rows_by_y[y_key] = []
-        rows_by_y[y_key].append(word)
+        rows_by_y[round(word["top"] / y_tolerance)].append(word)
 
     # Sort rows by Y position
     sorted_y_keys = sorted(rows_by_y.keys())
     page_width = page.width if hasattr(page, "width") else 612
 
-    # First pass: analyze each row
+    # First pass: analyze each row, and collect ALL x-positions from rows with
+    # 3+ columns (table-like rows). This gives us the global column structure.
     row_info: list[dict] = []
+    all_table_x_positions: list[float] = []
     for y_key in sorted_y_keys:
         row_words = sorted(rows_by_y[y_key], key=lambda w: w["x0"])
         if not row_words:
@@ -158,10 +202,11 @@ def _extract_form_content_from_words(page: Any) -> str | None:
         line_width = last_x1 - first_x0
         combined_text = " ".join(w["text"] for w in row_words)
 
-        # Count distinct x-position groups (columns)
-        x_positions = [w["x0"] for w in row_words]
+        # Count distinct x-position groups (columns). The words are already
+        # sorted by x0; rows are short, so a plain pass beats bisect here.
         x_groups: list[float] = []
-        for x in sorted(x_positions):
+        for w in row_words:
+            x = w["x0"]
             if not x_groups or x - x_groups[-1] > 50:
                 x_groups.append(x)
 
@@ -170,11 +215,7 @@ def _extract_form_content_from_words(page: Any) -> str | None:
 
         # Check for MasterFormat-style partial numbering (e.g., ".1", ".2")
         # These should be treated as list items, not table rows
-        has_partial_numbering = False
-        if row_words:
-            first_word = row_words[0]["text"].strip()
-            if PARTIAL_NUMBERING_PATTERN.match(first_word):
-                has_partial_numbering = True
+        has_partial_numbering = _is_partial_numbering(row_words[0]["text"].strip())
 
         row_info.append(
             {
@@ -188,12 +229,8 @@ def _extract_form_content_from_words(page: Any) -> str | None:
             }
         )
 
-    # Collect ALL x-positions from rows with 3+ columns (table-like rows)
-    # This gives us the global column structure
-    all_table_x_positions: list[float] = []
-    for info in row_info:
-        if info["num_columns"] >= 3 and not info["is_paragraph"]:
-            all_table_x_positions.extend(info["x_groups"])
+        if len(x_groups) >= 3 and not is_paragraph:
+            all_table_x_positions.extend(x_groups)
 
     if not all_table_x_positions:
         return None
@@ -201,19 +238,18 @@ def _extract_form_content_from_words(page: Any) -> str | None:
     # Compute adaptive column clustering tolerance based on gap analysis
     all_table_x_positions.sort()
 
-    # Calculate gaps between consecutive x-positions
-    gaps = []
-    for i in range(len(all_table_x_positions) - 1):
-        gap = all_table_x_positions[i + 1] - all_table_x_positions[i]
-        if gap > 5:  # Only significant gaps
-            gaps.append(gap)
+    # Calculate gaps between consecutive x-positions (only significant gaps)
+    gaps = [
+        x1 - x0
+        for x0, x1 in zip(all_table_x_positions, all_table_x_positions[1:])
+        if x1 - x0 > 5
+    ]
 
     # Determine optimal tolerance using statistical analysis
     if gaps and len(gaps) >= 3:
         # Use 70th percentile of gaps as threshold (balances precision/recall)
-        sorted_gaps = sorted(gaps)
-        percentile_70_idx = int(len(sorted_gaps) * 0.70)
-        adaptive_tolerance = sorted_gaps[percentile_70_idx]
+        gaps.sort()
+        adaptive_tolerance = gaps[int(len(gaps) * 0.70)]
 
         # Clamp tolerance to reasonable range [25, 50]
         adaptive_tolerance = max(25, min(50, adaptive_tolerance))
@@ -222,10 +258,7 @@ def _extract_form_content_from_words(page: Any) -> str | None:
         adaptive_tolerance = 35
 
     # Compute global column boundaries using adaptive tolerance
-    global_columns: list[float] = []
-    for x in all_table_x_positions:
-        if not global_columns or x - global_columns[-1] > adaptive_tolerance:
-            global_columns.append(x)
+    global_columns = _cluster_positions(all_table_x_positions, adaptive_tolerance)
 
     # Adaptive max column check based on page characteristics
     # Calculate average column width
@@ -257,6 +290,7 @@ def _extract_form_content_from_words(page: Any) -> str | None:
         return None
 
     # Now classify each row as table row or not
+    num_global_columns = len(global_columns)
     # A row is a table row if it has words that align with 2+ of the global columns
     for info in row_info:
         if info["is_paragraph"]:
@@ -268,17 +302,27 @@ def _extract_form_content_from_words(page: Any) -> str | None:
             info["is_table_row"] = False
             continue
 
-        # Count how many global columns this row's words align with
-        aligned_columns: set[int] = set()
+        # Check whether this row's words align with 2+ of the global columns
+        # (i.e., the first column within 40pt of each word, found by binary search).
+        # Words are sorted by x0, so their columns come in increasing order and we
+        # can stop at the second distinct one.
+        is_table_row = False
+        first_aligned_col = -1
         for word in info["words"]:
             word_x = word["x0"]
-            for col_idx, col_x in enumerate(global_columns):
-                if abs(word_x - col_x) < 40:
-                    aligned_columns.add(col_idx)
+            col_idx = bisect.bisect_right(global_columns, word_x - 40)
+            if (
+                col_idx < num_global_columns
+                and abs(word_x - global_columns[col_idx]) < 40
+            ):
+                if first_aligned_col < 0:
+                    first_aligned_col = col_idx
+                elif col_idx != first_aligned_col:
+                    is_table_row = True
                     break
 
         # If row uses 2+ of the established columns, it's a table row
-        info["is_table_row"] = len(aligned_columns) >= 2
+        info["is_table_row"] = is_table_row
 
     # Find table regions (consecutive table rows)
     table_regions: list[tuple[int, int]] = []  # (start_idx, end_idx)
@@ -302,23 +346,21 @@ def _extract_form_content_from_words(page: Any) -> str | None:
     result_lines: list[str] = []
     num_cols = len(global_columns)
 
+    # A word belongs to the first column whose successor starts more than 20pt to
+    # its right; anything past the last boundary falls into the last column
+    col_bounds = [col_x - 20 for col_x in global_columns[1:]]
+
     # Helper function to extract cells from a row
     def extract_cells(info: dict) -> list[str]:
-        cells: list[str] = ["" for _ in range(num_cols)]
+        cells: list[list[str]] = [[] for _ in range(num_cols)]
         for word in info["words"]:
-            word_x = word["x0"]
             # Find the correct column using boundary ranges
-            assigned_col = num_cols - 1  # Default to last column
-            for col_idx in range(num_cols - 1):
-                col_end = global_columns[col_idx + 1]
-                if word_x < col_end - 20:
-                    assigned_col = col_idx
-                    break
-            if cells[assigned_col]:
-                cells[assigned_col] += " " + word["text"]
-            else:
-                cells[assigned_col] = word["text"]
-        return cells
+            assigned_col = bisect.bisect_right(col_bounds, word["x0"])
+            cells[assigned_col].append(word["text"])
+        return [" ".join(cell) for cell in cells]
+
+    # Map each table region's start row to its end row
+    table_region_ends = dict(table_regions)
 
     # Process rows, collecting table data for proper formatting
     idx = 0
@@ -326,14 +368,10 @@ def _extract_form_content_from_words(page: Any) -> str | None:
         info = row_info[idx]
 
         # Check if this row starts a table region
-        table_region = None
-        for start, end in table_regions:
-            if idx == start:
-                table_region = (start, end)
-                break
-
-        if table_region:
-            start, end = table_region
+        end = table_region_ends.get(idx)
+
+        if end is not None:
+            start = idx
             # Collect all rows in this table
             table_data: list[list[str]] = []
             for table_idx in range(start, end):
@@ -342,79 +380,55 @@ def _extract_form_content_from_words(page: Any) -> str | None:
 
             # Calculate column widths for this table
             if table_data:
-                col_widths = [
-                    max(len(row[col]) for row in table_data) for col in range(num_cols)
-                ]
                 # Ensure minimum width of 3 for separator dashes
-                col_widths = [max(w, 3) for w in col_widths]
+                col_widths = [max(3, max(map(len, col))) for col in zip(*table_data)]
 
-                # Format header row
-                header = table_data[0]
-                header_str = (
-                    "| "
-                    + " | ".join(
-                        cell.ljust(col_widths[i]) for i, cell in enumerate(header)
-                    )
-                    + " |"
+                # Build the row template once, with each cell left-aligned to
+                # its column width
+                row_template = (
+                    "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |"
                 )
-                result_lines.append(header_str)
+
+                # Format header row
+                result_lines.append(row_template.format(*table_data[0]))
 
                 # Format separator row
-                separator = (
-                    "| "
-                    + " | ".join("-" * col_widths[i] for i in range(num_cols))
-                    + " |"
+                result_lines.append(
+                    "| " + " | ".join("-" * w for w in col_widths) + " |"
                 )
-                result_lines.append(separator)
 
                 # Format data rows
-                for row in table_data[1:]:
-                    row_str = (
-                        "| "
-                        + " | ".join(
-                            cell.ljust(col_widths[i]) for i, cell in enumerate(row)
-                        )
-                        + " |"
-                    )
-                    result_lines.append(row_str)
+                result_lines.extend(row_template.format(*row) for row in table_data[1:])
 
             idx = end  # Skip to end of table region
         else:
-            # Check if we're inside a table region (not at start)
-            in_table = False
-            for start, end in table_regions:
-                if start < idx < end:
-                    in_table = True
-                    break
-
-            if not in_table:
-                # Non-table content
-                result_lines.append(info["text"])
+            # Non-table content (rows inside a table region are skipped above)
+            result_lines.append(info["text"])
             idx += 1
 
     return "\n".join(result_lines)
 
 
-def _extract_tables_from_words(page: Any) -> list[list[list[str]]]:
+def _extract_tables_from_words(page: Any, words: list[dict]) -> list[list[list[str]]]:
     """
     Extract tables from a PDF page by analyzing word positions.
     This handles borderless tables where words are aligned in columns.
 
     This function is designed for structured tabular data (like invoices),
     not for multi-column text layouts in scientific documents.
+
+    Args:
+        page: The pdfplumber page
+        words: The page's words, as returned by _extract_page_words
     """
-    words = page.extract_words(keep_blank_chars=True, x_tolerance=3, y_tolerance=3)
     if not words:
         return []
 
-    # Group words by their Y position (rows)
+    # Group words by their Y position (rows), keyed by integer bucket index
     y_tolerance = 5
-    rows_by_y: dict[float, list[dict]] = {}
+    rows_by_y: defaultdict[int, list[dict]] = defaultdict(list)
     for word in words:
-        y_key = round(word["top"] / y_tolerance) * y_tolerance
-        if y_key not in rows_by_y:
-            rows_by_y[y_key] = []
-        rows_by_y[y_key].append(word)
+        rows_by_y[round(word["top"] / y_tolerance)].append(word)
 
     # Sort rows by Y position
     sorted_y_keys = sorted(rows_by_y.keys())
@@ -431,41 +445,44 @@ def _extract_tables_from_words(page: Any) -> list[list[list[str]]]:
     # Cluster x positions to find column starts
     all_x_positions.sort()
     x_tolerance_col = 20
-    column_starts: list[float] = []
-    for x in all_x_positions:
-        if not column_starts or x - column_starts[-1] > x_tolerance_col:
-            column_starts.append(x)
+    column_starts = _cluster_positions(all_x_positions, x_tolerance_col)
 
     # Need at least 3 columns but not too many (likely text layout, not table)
     if len(column_starts) < 3 or len(column_starts) > 10:
         return []
 
-    # Find rows that span multiple columns (potential table rows)
+    # Find rows that span multiple columns (potential table rows), tallying
+    # the long cells of kept rows as we go (see the quality check below)
     table_rows = []
+    long_cell_count = 0
+    total_cell_count = 0
     for y_key in sorted_y_keys:
         words_in_row = sorted(rows_by_y[y_key], key=lambda w: w["x0"])
 
         # Assign words to columns
-        row_data = [""] * len(column_starts)
+        row_cells: list[list[str]] = [[] for _ in column_starts]
         for word in words_in_row:
-            # Find the closest column
-            best_col = 0
-            min_dist = float("inf")
-            for i, col_x in enumerate(column_starts):
-                dist = abs(word["x0"] - col_x)
-                if dist < min_dist:
-                    min_dist = dist
-                    best_col = i
-
-            if row_data[best_col]:
-                row_data[best_col] += " " + word["text"]
-            else:
-                row_data[best_col] = word["text"]
+            # Find the closest column (the lower one, on ties). Since column_starts
+            # is sorted, it's one of the two neighbors of the word's insertion point.
+            word_x = word["x0"]
+            best_col = bisect.bisect_left(column_starts, word_x)
+            if best_col == len(column_starts) or (
+                best_col > 0
+                and word_x - column_starts[best_col - 1]
+                <= column_starts[best_col] - word_x
+            ):
+                best_col -= 1
+
+            row_cells[best_col].append(word["text"])
+        row_data = [" ".join(cell) for cell in row_cells]
 
         # Only include rows that have content in multiple columns
-        non_empty = sum(1 for cell in row_data if cell.strip())
-        if non_empty >= 2:
+        non_empty_cells = [stripped for cell in row_data if (stripped := cell.strip())]
+        if len(non_empty_cells) >= 2:
             table_rows.append(row_data)
+            total_cell_count += len(non_empty_cells)
+            # If cell has more than 30 chars, it's likely prose text
+            long_cell_count += sum(1 for cell in non_empty_cells if len(cell) > 30)
 
     # Validate table quality - tables should have:
     # 1. Enough rows (at least 3 including header)
@@ -474,29 +491,100 @@ def _extract_tables_from_words(page: Any) -> list[list[list[str]]]:
     if len(table_rows) < 3:
         return []
 
-    # Check if cells contain short, structured data (not long text)
-    long_cell_count = 0
-    total_cell_count = 0
-    for row in table_rows:
-        for cell in row:
-            if cell.strip():
-                total_cell_count += 1
-                # If cell has more than 30 chars, it's likely prose text
-                if len(cell.strip()) > 30:
-                    long_cell_count += 1
-
-    # If more than 30% of cells are long, this is probably not a table
+    # Check if cells contain short, structured data (not long text):
+    # if more than 30% of cells are long, this is probably not a table
     if total_cell_count > 0 and long_cell_count / total_cell_count > 0.3:
         return []
 
     return [table_rows]
 
 
+def _extract_text_with_pdfium(pdf_file: io.IOBase) -> str:
+    """
+    Extract the plain text of every page with PDFium, which is much faster than
+    pdfminer (though its spacing and line breaks can differ). As in pdfminer's
+    output, each page ends with a form feed.
+    """
+    pdf = pypdfium2.PdfDocument(pdf_file)
+    try:
+        page_texts: list[str] = []
+        for page in pdf:
+            text_page = page.get_textpage()
+            page_texts.append(text_page.get_text_bounded().replace("\r\n", "\n"))
+            text_page.close()
+            page.close()
+    finally:
+        pdf.close()
+
+    return "".join(f"{text}\f" for text in page_texts)
+
+
+def _convert_pdf_page(page: Any) -> tuple[bool, str]:
+    """
+    Convert a single pdfplumber page.
+
+    Returns a tuple of (is_form_page, markdown), where markdown may be empty.
+    The page's parsed objects are released afterwards, so memory use does not
+    grow with the number of pages.
+    """
+    try:
+        # Try form-style word position extraction
+        page_content = _extract_form_content_from_words(page, _extract_page_words(page))
+
+        # If extraction returns None, this page is not form-style
+        if page_content is None:
+            # Extract text using pdfplumber's basic extraction for this page
+            text = page.extract_text()
+            return False, text.strip() if text else ""
+
+        return True, page_content if page_content.strip() else ""
+    finally:
+        page.close()
+
+
+def _convert_pdf_pages(
+    pdf_data: bytes, page_numbers: list[int]
+) -> list[tuple[bool, str]]:
+    """
+    Convert a subset of a PDF's pages (1-based page numbers). Runs in a worker process.
+    """
+    with pdfplumber.open(io.BytesIO(pdf_data), pages=page_numbers) as pdf:
+        return [_convert_pdf_page(page) for page in pdf.pages]
+
+
+def _convert_pdf_pages_in_parallel(
+    pdf_data: bytes, num_pages: int, max_workers: int
+) -> list[tuple[bool, str]]:
+    """
+    Split the pages of a PDF into contiguous chunks, one per worker process, and
+    convert them in parallel. Results are returned in page order.
+    """
+    num_chunks = min(max_workers, num_pages)
+    chunk_size = -(-num_pages // num_chunks)  # Ceiling division
+    page_numbers = list(range(1, num_pages + 1))
+    chunks = [page_numbers[i : i + chunk_size] for i in range(0, num_pages, chunk_size)]
+
+    results: list[tuple[bool, str]] = []
+    with ProcessPoolExecutor(max_workers=num_chunks) as executor:
+        for chunk_results in executor.map(
+            _convert_pdf_pages, [pdf_data] * len(chunks), chunks
+        ):
+            results.extend(chunk_results)
+    return results
+
+
 class PdfConverter(DocumentConverter):
     """
     Converts PDFs to Markdown.
     Supports extracting tables into aligned Markdown format (via pdfplumber).
     Falls back to pdfminer if pdfplumber is missing or fails.
+
+    Pass `pdf_max_workers=N` to convert the pages of multi-page PDFs in up to N
+    worker processes (by default, pages are converted serially).
+
+    Pass `pdf_use_pdfium=True` to extract mostly plain-text PDFs with PDFium
+    (pypdfium2) instead of pdfminer. It is much faster, but the text layout may
+    differ slightly; pdfminer remains the fallback if PDFium fails.
     """
 
     def accepts(
@@ -538,48 +626,78 @@ class PdfConverter(DocumentConverter):
 
         markdown_chunks: list[str] = []
 
-        # Read file stream into BytesIO for compatibility with pdfplumber
-        pdf_bytes = io.BytesIO(file_stream.read())
+        # pdfplumber and pdfminer can read the stream in place, provided the PDF
+        # starts at offset 0 (xref offsets are absolute). Otherwise, copy it.
+        if file_stream.seekable() and file_stream.tell() == 0:
+            pdf_file: io.IOBase = file_stream
+        else:
+            pdf_file = io.BytesIO(file_stream.read())
+
+        # Optionally spread the pages of multi-page PDFs across worker processes
+        max_workers = kwargs.get("pdf_max_workers") or 1
+        use_pdfium = kwargs.get("pdf_use_pdfium", False) and pypdfium2 is not None
+
+        # Set once the text has come from pdfminer, so an empty result is final
+        used_pdfminer = False
 
         try:
             # Track how many pages are form-style vs plain text
             form_pages = 0
             plain_pages = 0
 
-            with pdfplumber.open(pdf_bytes) as pdf:
-                for page in pdf.pages:
-                    # Try form-style word position extraction
-                    page_content = _extract_form_content_from_words(page)
-
-                    # If extraction returns None, this page is not form-style
-                    if page_content is None:
-                        plain_pages += 1
-                        # Extract text using pdfplumber's basic extraction for this page
-                        text = page.extract_text()
-                        if text and text.strip():
-                            markdown_chunks.append(text.strip())
-                    else:
+            # pdfplumber only declares BytesIO/BufferedReader, but any binary stream works
+            with pdfplumber.open(cast(io.BytesIO, pdf_file)) as pdf:
+                num_pages = len(pdf.pages)
+                page_results: Iterable[tuple[bool, str]]
+                if max_workers > 1 and num_pages > 1:
+                    pdf_file.seek(0)
+                    try:
+                        page_results = _convert_pdf_pages_in_parallel(
+                            pdf_file.read(), num_pages, max_workers
+                        )
+                    except (OSError, RuntimeError):
+                        # The worker pool could not be started or died (e.g.,
+                        # BrokenProcessPool), so convert the pages serially instead
+                        page_results = map(_convert_pdf_page, pdf.pages)
+                else:
+                    # Converted lazily, so the loop below can stop early
+                    page_results = map(_convert_pdf_page, pdf.pages)
+
+                for is_form_page, page_markdown in page_results:
+                    if is_form_page:
                         form_pages += 1
-                        if page_content.strip():
-                            markdown_chunks.append(page_content)
+                    else:
+                        plain_pages += 1
+                    if page_markdown:
+                        markdown_chunks.append(page_markdown)
+
+                    # Once plain pages are a strict majority, pdfminer will be used
+                    # whatever the remaining pages are, so stop converting them
+                    if plain_pages * 2 > num_pages:
+                        break
 
             # If most pages are plain text, use pdfminer for better text handling
             if plain_pages > form_pages and plain_pages > 0:
-                pdf_bytes.seek(0)
-                markdown = pdfminer.high_level.extract_text(pdf_bytes)
+                pdf_file.seek(0)
+                if use_pdfium:
+                    markdown = _extract_text_with_pdfium(pdf_file)
+                else:
+                    markdown = pdfminer.high_level.extract_text(pdf_file)
+                    used_pdfminer = True
             else:
                 # Build markdown from chunks
                 markdown = "\n\n".join(markdown_chunks).strip()
 
         except Exception:
             # Fallback if pdfplumber fails
-            pdf_bytes.seek(0)
-            markdown = pdfminer.high_level.extract_text(pdf_bytes)
-
-        # Fallback if still empty
-        if not markdown:
-            pdf_bytes.seek(0)
-            markdown = pdfminer.high_level.extract_text(pdf_bytes)
+            pdf_file.seek(0)
+            markdown = pdfminer.high_level.extract_text(pdf_file)
+            used_pdfminer = True
+
+        # Fallback if still empty (pdfminer would return the same text again)
+        if not markdown and not used_pdfminer:
+            pdf_file.seek(0)
+            markdown = pdfminer.high_level.extract_text(pdf_file)
 
         # Post-process to merge MasterFormat-style partial numbering with following text
         markdown = _merge_partial_numbering_lines(markdown)
@@ -0,0 +1,27 @@
+"""Shared fixtures for the markitdown test suite."""
+
+import pytest
+
+from markitdown import MarkItDown
+
+
+@pytest.fixture(scope="session")
+def markitdown():
+    """Create one MarkItDown instance, shared by every test in the session."""
+    return MarkItDown()
+
+
+@pytest.fixture(scope="session")
+def convert_pdf(markitdown):
+    """
+    Convert test PDFs with default options, once per session. The same file is
+    checked by many tests, so the (read-only) results are shared between them.
+    """
+    results = {}
+
+    def convert(pdf_path):
+        if pdf_path not in results:
+            results[pdf_path] = markitdown.convert(pdf_path)
+        return results[pdf_path]
+
+    return convert
@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import MagicMock
 
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown.converters import _markdownify
+from markitdown.converters._markdownify import _CustomMarkdownify
 
 from markitdown import (
     MarkItDown,
@@ -51,6 +53,23 @@ MP3_TEST_EXIFTOOL = {
     "SampleRate": "48000",
 }
 
+# HTML snippets and their Markdown with latex_sup_sub enabled
+LATEX_SUP_SUB_TEST_CASES = [
+    ("<p>x<sup>2</sup></p>", "$x^2$"),
+    ("<p>H<sub>2</sub>O</p>", "$H_2$O"),
+    ("<p>y<sup>n+1</sup></p>", "$y^{n+1}$"),
+    # Nested scripts are folded into a single math span
+    ("<p>a<sup>b<sub>c</sub></sup></p>", "$a^{b_c}$"),
+    ("<p>a<sup>b<sub>cd</sub></sup></p>", "$a^{b_{cd}}$"),
+    ("<p>2<sup>x<sub>a_b</sub></sup></p>", "$2^{x_{a_b}}$"),
+    ("<p>e<sup>x<sup>2</sup></sup></p>", "$e^{x^2}$"),
+    # With no preceding token there is no base, so only the marker is kept
+    ("<p><sup>th</sup> place</p>", "^th place"),
+    # Underscores are escaped in text, but not inside math
+    ("<p>snake_case and x<sub>i_j</sub></p>", "snake\\_case and $x_{i_j}$"),
+    ("<p>$a_b$ and a_b</p>", "$a_b$ and a\\_b"),
+]
+
 PDF_TEST_URL = "https://arxiv.org/pdf/2308.08155v2.pdf"
 PDF_TEST_STRINGS = [
     "While there is contemporaneous exploration of multi-agent approaches"
@@ -290,6 +309,28 @@ def test_docx_highlight() -> None:
     assert "background-color" not in result.text_content
 
 
+def test_latex_sup_sub() -> None:
+    # Pin the standard library engine, since google-re2 is picked up when installed
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            _markdownify, "_SUP_SUB_RE", re.compile(_markdownify._SUP_SUB_RE.pattern)
+        )
+        converter = _CustomMarkdownify(latex_sup_sub=True)
+        for html, expected in LATEX_SUP_SUB_TEST_CASES:
+            assert converter.convert(html) == expected, html
+
+
+def test_latex_sup_sub_re2(monkeypatch) -> None:
+    # The optional google-re2 engine must give the same results as the standard library
+    re2 = pytest.importorskip("re2")
+    monkeypatch.setattr(
+        _markdownify, "_SUP_SUB_RE", re2.compile(_markdownify._SUP_SUB_RE.pattern)
+    )
+    converter = _CustomMarkdownify(latex_sup_sub=True)
+    for html, expected in LATEX_SUP_SUB_TEST_CASES:
+        assert converter.convert(html) == expected, html
+
+
 def test_input_as_strings() -> None:
     markitdown = MarkItDown()
 
@@ -304,6 +345,27 @@ def test_input_as_strings() -> None:
     assert "# Test" in result.text_content
 
 
+def test_html_links() -> None:
+    markitdown = MarkItDown()
+
+    input_data = (
+        b"<html><body><p>"
+        b'<a href="https://example.com/plain/path">plain</a> '
+        b'<a href="https://example.com/a b/c:d?q=1">escaped</a> '
+        b'<a href="https://example.com/plain/path">repeated</a> '
+        b'<a href="javascript:alert(1)">script</a>'
+        b"</p></body></html>"
+    )
+    result = markitdown.convert_stream(
+        io.BytesIO(input_data), stream_info=StreamInfo(extension=".html")
+    )
+    assert "[plain](https://example.com/plain/path)" in result.text_content
+    assert "[escaped](https://example.com/a%20b/c%3Ad?q=1)" in result.text_content
+    assert "[repeated](https://example.com/plain/path)" in result.text_content
+    assert "script" in result.text_content
+    assert "javascript" not in result.text_content
+
+
 def test_doc_rlink() -> None:
     # Test for: CVE-2025-11849
     markitdown = MarkItDown()
@@ -505,7 +567,9 @@ if __name__ == "__main__":
         test_data_uris,
         test_file_uris,
         test_docx_comments,
+        test_latex_sup_sub,
         test_input_as_strings,
+        test_html_links,
         test_markitdown_remote,
         test_speech_transcription,
         test_exceptions,
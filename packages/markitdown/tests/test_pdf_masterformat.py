@@ -5,10 +5,13 @@ import os
 import re
 import pytest
 
-from markitdown import MarkItDown
-from markitdown.converters._pdf_converter import PARTIAL_NUMBERING_PATTERN
+from markitdown.converters._pdf_converter import (
+    PARTIAL_NUMBERING_PATTERN,
+    _is_partial_numbering,
+)
 
 TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
+MASTERFORMAT_PDF = os.path.join(TEST_FILES_DIR, "masterformat_partial_numbering.pdf")
 
 
 class TestMasterFormatPartialNumbering:
@@ -31,7 +34,14 @@ class TestMasterFormatPartialNumbering:
         assert PARTIAL_NUMBERING_PATTERN.match(".a") is None
         assert PARTIAL_NUMBERING_PATTERN.match("") is None
 
-    def test_masterformat_partial_numbering_not_split(self):
+    def test_is_partial_numbering_matches_pattern(self):
+        """Test that the string-based check agrees with the regex pattern."""
+        for text in [".1", ".10", ".99", "1.", "1.2", ".1.2", "text", ".a", ".", ""]:
+            assert _is_partial_numbering(text) == bool(
+                PARTIAL_NUMBERING_PATTERN.match(text)
+            ), text
+
+    def test_masterformat_partial_numbering_not_split(self, convert_pdf):
         """Test that MasterFormat partial numbering stays with associated text.
 
         MasterFormat documents use partial numbering like:
@@ -41,10 +51,7 @@ class TestMasterFormatPartialNumbering:
         These should NOT be split into separate table columns, but kept
         as coherent text lines with the number followed by its description.
         """
-        pdf_path = os.path.join(TEST_FILES_DIR, "masterformat_partial_numbering.pdf")
-
-        markitdown = MarkItDown()
-        result = markitdown.convert(pdf_path)
+        result = convert_pdf(MASTERFORMAT_PDF)
         text_content = result.text_content
 
         # Partial numberings should NOT appear isolated on their own lines
@@ -70,12 +77,9 @@ class TestMasterFormatPartialNumbering:
             len(partial_with_text) > 0
         ), "Expected to find partial numberings followed by text on the same line"
 
-    def test_masterformat_content_preserved(self):
+    def test_masterformat_content_preserved(self, convert_pdf):
         """Test that MasterFormat document content is fully preserved."""
-        pdf_path = os.path.join(TEST_FILES_DIR, "masterformat_partial_numbering.pdf")
-
-        markitdown = MarkItDown()
-        result = markitdown.convert(pdf_path)
+        result = convert_pdf(MASTERFORMAT_PDF)
         text_content = result.text_content
 
         # Verify key content from the MasterFormat document is preserved
@@ -112,7 +116,7 @@ class TestMasterFormatPartialNumbering:
             len(text_content.strip()) > 100
         ), "MasterFormat document should have substantial text content"
 
-    def test_merge_partial_numbering_with_empty_lines_between(self):
+    def test_merge_partial_numbering_with_empty_lines_between(self, convert_pdf):
         """Test that partial numberings merge correctly even with empty lines between.
 
         When PDF extractors produce output like:
@@ -122,10 +126,7 @@ class TestMasterFormatPartialNumbering:
 
         The merge logic should still combine them properly.
         """
-        pdf_path = os.path.join(TEST_FILES_DIR, "masterformat_partial_numbering.pdf")
-
-        markitdown = MarkItDown()
-        result = markitdown.convert(pdf_path)
+        result = convert_pdf(MASTERFORMAT_PDF)
         text_content = result.text_content
 
         # The merged result should have .1 and .2 followed by text
@@ -145,12 +146,9 @@ class TestMasterFormatPartialNumbering:
                         )
                         break
 
-    def test_multiple_partial_numberings_all_merged(self):
+    def test_multiple_partial_numberings_all_merged(self, convert_pdf):
         """Test that all partial numberings in a document are properly merged."""
-        pdf_path = os.path.join(TEST_FILES_DIR, "masterformat_partial_numbering.pdf")
-
-        markitdown = MarkItDown()
-        result = markitdown.convert(pdf_path)
+        result = convert_pdf(MASTERFORMAT_PDF)
         text_content = result.text_content
 
         # Count occurrences of merged partial numberings (number followed by text)